@@ -19,9 +19,10 @@ of a quantum tape.
 import functools
 import warnings
 from collections.abc import Sequence
+from math import factorial
 
 import numpy as np
-from scipy.special import factorial
+from autograd.numpy.numpy_boxes import ArrayBox
 
 import pennylane as qml
 
@@ -55,7 +56,7 @@ def finite_diff_coeffs(n, approx_order, strategy):
             unshifted point: :math:`\dots, x_0-2h, x_0-h, x_0, x_0+h, x_0+2h,\dots`.
 
     Returns:
-        array[float]: A ``(2, N)`` array. The first row corresponds to the
+        array[float]: A read-only ``(2, N)`` array. The first row corresponds to the
         coefficients, and the second row corresponds to the shifts.
 
     **Example**
@@ -136,24 +137,78 @@ def finite_diff_coeffs(n, approx_order, strategy):
         )
 
     # solve for the coefficients
-    A = shifts ** np.arange(len(shifts)).reshape(-1, 1)
+    A = np.vander(shifts, increasing=True).T
     b = np.zeros_like(shifts)
     b[n] = factorial(n)
     coeffs = np.linalg.solve(A, b)
 
-    coeffs_and_shifts = np.stack([coeffs, shifts])
+    # remove all terms with small coefficients; the shifts are integers,
+    # so they never have to be truncated themselves
+    mask = np.abs(coeffs) >= 1e-10
+    coeffs, shifts = coeffs[mask], shifts[mask]
 
-    # remove all small coefficients and shifts
-    coeffs_and_shifts[np.abs(coeffs_and_shifts) < 1e-10] = 0
+    # sort terms in ascending order according to abs(shift)
+    order = np.argsort(np.abs(shifts))
+    coeffs_and_shifts = np.stack([coeffs[order], shifts[order]])
 
-    # remove columns where the coefficients are 0
-    coeffs_and_shifts = coeffs_and_shifts[:, ~np.all(coeffs_and_shifts == 0, axis=0)]
-
-    # sort columns in ascending order according to abs(shift)
-    coeffs_and_shifts = coeffs_and_shifts[:, np.argsort(np.abs(coeffs_and_shifts)[1])]
+    # the output is cached and shared between all callers, so we
+    # prevent it from being modified in-place
+    coeffs_and_shifts.flags.writeable = False
     return coeffs_and_shifts
 
 
+def _is_differentiated(param):
+    """Check whether a tape parameter is currently being differentiated
+    by an autodiff framework, e.g., when computing higher-order derivatives.
+
+    Args:
+        param (tensor_like): the tape parameter
+
+    Returns:
+        bool: whether the parameter is being differentiated
+    """
+    if isinstance(param, ArrayBox):
+        return True
+
+    if qml.math.get_interface(param) == "autograd":
+        # PennyLane NumPy tensors report whether they are trainable,
+        # even if they are not being differentiated by Autograd
+        return False
+
+    return qml.math.requires_grad(param)
+
+
+def _broadcasting_supported(tape, method_map):
+    """Check whether the trainable parameters of a tape that are to be shifted
+    can be batched together into broadcasted tapes.
+
+    Args:
+        tape (.QuantumTape): the quantum tape to differentiate
+        method_map (dict[int, str]): map from the trainable parameter indices
+            to their differentiation method
+
+    Returns:
+        bool: whether broadcasted tapes can be created for all shifted parameters.
+        This is not the case if the tape is already broadcasted, if any of the
+        trainable parameters is being differentiated by an autodiff framework,
+        or if any operation with a shifted parameter does not support broadcasting.
+    """
+    if tape.batch_size is not None:
+        # the tape is already broadcasted
+        return False
+
+    if any(_is_differentiated(p) for p in tape.get_parameters()):
+        # Differentiating a broadcasted tape would treat the
+        # broadcasted shifts of a parameter as a single value
+        return False
+
+    return all(
+        tape.get_operation(idx)[0] in qml.ops.qubit.attributes.supports_broadcasting
+        for idx, method in method_map.items()
+        if method != "0"
+    )
+
+
 def _no_trainable_grad_new(tape):
     warnings.warn(
         "Attempted to compute the gradient of a tape with no trainable parameters. "
@@ -197,6 +252,7 @@ def _finite_diff_new(
     strategy="forward",
     f0=None,
     validate_params=True,
+    broadcast=False,
 ):
     r"""Transform a QNode to compute the finite-difference gradient of all gate
     parameters with respect to its inputs. This function is adapted to the new return system.
@@ -224,6 +280,11 @@ def _finite_diff_new(
             the ``Operation.grad_method`` attribute and the circuit structure will be analyzed
             to determine if the trainable parameters support the finite-difference method.
             If ``False``, the finite-difference method will be applied to all parameters.
+        broadcast (bool): Whether or not to use parameter broadcasting to create
+            a single broadcasted tape per operation instead of one tape per shift.
+            If any operation with a shifted parameter does not support broadcasting, or
+            if the tape parameters are being differentiated by an autodiff framework, e.g.,
+            when computing higher-order derivatives, one tape per shift is created instead.
 
     Returns:
         tensor_like or tuple[list[QuantumTape], function]:
@@ -240,6 +301,12 @@ def _finite_diff_new(
 
     #TODO: Add example for new return type.
     """
+    if broadcast and len(tape.measurements) > 1:
+        raise NotImplementedError(
+            "Broadcasting with multiple measurements is not supported yet. "
+            f"Set broadcast to False instead. The tape measurements are {tape.measurements}."
+        )
+
     if argnum is None and not tape.trainable_params:
         return _no_trainable_grad_new(tape)
 
@@ -273,15 +340,29 @@ def _finite_diff_new(
         shifts = shifts[1:]
         coeffs = coeffs[1:]
 
+    # Fold the step size normalization into the coefficients, so that
+    # the post-processing only has to compute a linear combination.
+    coeffs = coeffs / h**n
+    if c0 is not None:
+        c0 = c0 / h**n
+
     method_map = choose_grad_methods(diff_methods, argnum)
 
+    # The shifts are identical for all parameters, so they
+    # only need to be scaled by the step size once.
+    shifts = shifts * h
+
+    # Broadcasting is only used if all shifted parameters support it, falling back to
+    # one tape per shift otherwise. A single shift does not benefit from broadcasting.
+    broadcast = broadcast and len(shifts) > 1 and _broadcasting_supported(tape, method_map)
+
     for i, _ in enumerate(tape.trainable_params):
         if i not in method_map or method_map[i] == "0":
             # parameter has zero gradient
             shapes.append(0)
             continue
 
-        g_tapes = generate_shifted_tapes(tape, i, shifts * h)
+        g_tapes = generate_shifted_tapes(tape, i, shifts, broadcast=broadcast)
         gradient_tapes.extend(g_tapes)
         shapes.append(len(g_tapes))
 
@@ -301,16 +382,9 @@ def _finite_diff_new(
         for s in shapes:
 
             if s == 0:
-                # parameter has zero gradient
-                if not isinstance(results[0], tuple):
-                    g = qml.math.zeros_like(results[0])
-                else:
-                    g = []
-                    for i in output_dims:
-                        zero = qml.math.squeeze(qml.math.zeros(i))
-                        g.append(zero)
-
-                grads.append(g)
+                # parameter has zero gradient. We don't know the output shape yet, so just memorize
+                # that this gradient will be set to zero, via grad = None
+                grads.append(None)
                 continue
 
             res = results[start : start + s]
@@ -322,7 +396,8 @@ def _finite_diff_new(
             pre_grads = []
 
             if len(tape.measurements) == 1:
-                res = qml.math.stack(res)
+                # with broadcasting, the single result contains all shifts along its first axis
+                res = res[0] if broadcast else qml.math.stack(res)
                 c = qml.math.convert_like(coeffs, res)
                 lin_comb = qml.math.tensordot(res, c, [[0], [0]])
                 pre_grads.append(lin_comb)
@@ -337,25 +412,32 @@ def _finite_diff_new(
             if c0 is not None:
                 if len(tape.measurements) == 1:
                     c = qml.math.convert_like(c0, r0)
-                    pre_grads = pre_grads + c * r0
+                    pre_grads[0] = pre_grads[0] + c * r0
                 else:
                     for i in range(len(tape.measurements)):
                         r_i = r0[i]
                         c = qml.math.convert_like(c0, r_i)
                         pre_grads[i] = pre_grads[i] + c * r_i
 
-            coeff_div = qml.math.cast_like(
-                qml.math.convert_like(1 / h**n, pre_grads[0]), pre_grads[0]
-            )
+            # Contracting zero-dimensional NumPy results returns NumPy scalars
+            # rather than arrays, so convert them to zero-dimensional arrays.
+            pre_grads = [np.asarray(g) if isinstance(g, np.generic) else g for g in pre_grads]
+            pre_grads = tuple(pre_grads) if len(tape.measurements) > 1 else pre_grads[0]
+
+            grads.append(pre_grads)
 
-            if len(tape.measurements) > 1:
-                pre_grads = tuple(
-                    qml.math.convert_like(i * coeff_div, coeff_div) for i in pre_grads
-                )
+        if any(g is None for g in grads):
+            # Fill in the zero-valued gradients; the zero-valued gradient
+            # is created once and shared between all such parameters
+            if len(tape.measurements) == 1:
+                # If no gradient was computed, there are no shifted results and the
+                # unshifted result has the shape of the gradient instead
+                nonzero_grads = [g for g in grads if g is not None]
+                zero_rep = qml.math.zeros_like(nonzero_grads[0] if nonzero_grads else results[0])
             else:
-                pre_grads = qml.math.convert_like(pre_grads[0] * coeff_div, coeff_div)
+                zero_rep = [qml.math.squeeze(qml.math.zeros(i)) for i in output_dims]
 
-            grads.append(pre_grads)
+            grads = [zero_rep if g is None else g for g in grads]
 
         # Single measurement
         if len(tape.measurements) == 1:
@@ -390,6 +472,7 @@ def finite_diff(
     strategy="forward",
     f0=None,
     validate_params=True,
+    broadcast=False,
 ):
     r"""Transform a QNode to compute the finite-difference gradient of all gate
     parameters with respect to its inputs.
@@ -417,6 +500,11 @@ def finite_diff(
             the ``Operation.grad_method`` attribute and the circuit structure will be analyzed
             to determine if the trainable parameters support the finite-difference method.
             If ``False``, the finite-difference method will be applied to all parameters.
+        broadcast (bool): Whether or not to use parameter broadcasting to create
+            a single broadcasted tape per operation instead of one tape per shift.
+            If any operation with a shifted parameter does not support broadcasting, or
+            if the tape parameters are being differentiated by an autodiff framework, e.g.,
+            when computing higher-order derivatives, one tape per shift is created instead.
 
     Returns:
         tensor_like or tuple[list[QuantumTape], function]:
@@ -490,6 +578,43 @@ def finite_diff(
         >>> fn(qml.execute(gradient_tapes, dev, None))
         [[-0.38751721 -0.18884787 -0.38355704]
          [ 0.69916862  0.34072424  0.69202359]]
+
+        When setting the keyword argument ``broadcast`` to ``True``, the shifted
+        circuit evaluations for each operation are batched together, resulting in
+        broadcasted tapes:
+
+        >>> with qml.tape.QuantumTape() as tape:
+        ...     qml.RX(params[0], wires=0)
+        ...     qml.RY(params[1], wires=0)
+        ...     qml.RX(params[2], wires=0)
+        ...     qml.expval(qml.PauliZ(0))
+        >>> gradient_tapes, fn = qml.gradients.finite_diff(
+        ...     tape, approx_order=2, strategy="center", broadcast=True
+        ... )
+        >>> len(gradient_tapes)
+        3
+        >>> [t.batch_size for t in gradient_tapes]
+        [2, 2, 2]
+
+        The postprocessing function will know that broadcasting is used and handle
+        the results accordingly:
+
+        >>> fn(qml.execute(gradient_tapes, dev, None))
+        array([[-0.3875172 , -0.18884787, -0.38355704]])
+
+        Note that using parameter broadcasting via ``broadcast=True`` is not supported for tapes
+        with multiple return values. Broadcasted tapes are only created if all operations
+        with trainable parameters support broadcasting, which can be checked via the
+        ``supports_broadcasting`` :class:`~.Attribute`:
+
+        >>> qml.RX in qml.ops.qubit.attributes.supports_broadcasting
+        True
+
+        Otherwise, as well as for tapes that are already broadcasted, for tapes with
+        parameters that are being differentiated by an autodiff framework, such as when
+        computing higher-order derivatives of a QNode, and for stencils with a single
+        shifted term, such as the default first-order forward difference, one tape per
+        shift is created.
     """
     if qml.active_return():
         return _finite_diff_new(
@@ -501,6 +626,13 @@ def finite_diff(
             strategy=strategy,
             f0=f0,
             validate_params=validate_params,
+            broadcast=broadcast,
+        )
+
+    if broadcast and len(tape.measurements) > 1:
+        raise NotImplementedError(
+            "Broadcasting with multiple measurements is not supported yet. "
+            f"Set broadcast to False instead. The tape measurements are {tape.measurements}."
         )
 
     if argnum is None and not tape.trainable_params:
@@ -541,56 +673,106 @@ def finite_diff(
         shifts = shifts[1:]
         coeffs = coeffs[1:]
 
+    # Fold the step size normalization into the coefficients, so that
+    # the post-processing only has to compute a linear combination.
+    coeffs = coeffs / h**n
+    if c0 is not None:
+        c0 = c0 / h**n
+
     method_map = choose_grad_methods(diff_methods, argnum)
 
+    # The shifts are identical for all parameters, so they
+    # only need to be scaled by the step size once.
+    shifts = shifts * h
+
+    # Broadcasting is only used if all shifted parameters support it, falling back to
+    # one tape per shift otherwise. A single shift does not benefit from broadcasting.
+    broadcast = broadcast and len(shifts) > 1 and _broadcasting_supported(tape, method_map)
+
     for i, _ in enumerate(tape.trainable_params):
         if i not in method_map or method_map[i] == "0":
             # parameter has zero gradient
             shapes.append(0)
             continue
 
-        g_tapes = generate_shifted_tapes(tape, i, shifts * h)
+        g_tapes = generate_shifted_tapes(tape, i, shifts, broadcast=broadcast)
         gradient_tapes.extend(g_tapes)
         shapes.append(len(g_tapes))
 
     def processing_fn(results):
         # HOTFIX: Apply the same squeezing as in qml.QNode to make the transform output consistent.
         # pylint: disable=protected-access
-        if tape._qfunc_output is not None and not isinstance(tape._qfunc_output, Sequence):
+        scalar_qfunc_output = tape._qfunc_output is not None and not isinstance(
+            tape._qfunc_output, Sequence
+        )
+        if scalar_qfunc_output:
             results = [qml.math.squeeze(res) for res in results]
 
-        grads = []
-        start = 1 if c0 is not None and f0 is None else 0
-        r0 = f0 or results[0]
+        if all(s == 0 for s in shapes):
+            # No parameter has a non-zero gradient, so there are no shifted
+            # results to contract and the gradients are shaped like the output
+            zero_rep = qml.math.zeros_like(results[0])
 
-        for s in shapes:
+            if getattr(zero_rep, "dtype", None) is np.dtype("object"):
+                zero_rep = qml.math.hstack(zero_rep)
 
-            if s == 0:
-                # parameter has zero gradient
-                g = qml.math.zeros_like(results[0])
-                grads.append(g)
-                continue
+            return qml.math.T(qml.math.stack([zero_rep] * len(shapes)))
 
-            res = results[start : start + s]
-            start = start + s
+        start = 1 if c0 is not None and f0 is None else 0
+        r0 = f0 or results[0]
 
-            # compute the linear combination of results and coefficients
-            res = qml.math.stack(res)
-            g = sum(c * r for c, r in zip(coeffs, res))
+        # All parameters with a non-zero gradient use the same stencil, so the shifted
+        # results are arranged as (num_nonzero_params, num_shifts, ...) and contracted
+        # with the coefficients at once, instead of separately for each parameter.
+        res = qml.math.stack(results[start:])
+        axis = 1
 
-            if c0 is not None:
-                # add on the unshifted term
-                g = g + c0 * r0
+        if not broadcast:
+            res = qml.math.reshape(res, (-1, len(coeffs)) + tuple(qml.math.shape(res)[1:]))
+        elif qml.math.get_interface(res) != "torch" and not scalar_qfunc_output:
+            # If the original output is not scalar and broadcasting is used, the broadcasting
+            # axis follows the measurement axis. For Torch, this is not true because the
+            # output of the broadcasted tape is flat due to the behaviour of the Torch device.
+            axis = 2
 
-            grads.append(g / (h**n))
+        nonzero_grads = qml.math.tensordot(res, qml.math.convert_like(coeffs, res), [[axis], [0]])
+
+        if c0 is not None:
+            # add on the unshifted term
+            nonzero_grads = nonzero_grads + c0 * r0
 
         # The following is for backwards compatibility; currently,
         # the device stacks multiple measurement arrays, even if not the same
         # size, resulting in a ragged array.
         # In the future, we might want to change this so that only tuples
         # of arrays are returned.
-        for i, g in enumerate(grads):
-            if hasattr(g, "dtype") and g.dtype is np.dtype("object"):
+        ragged = getattr(nonzero_grads, "dtype", None) is np.dtype("object")
+
+        if 0 not in shapes and not ragged:
+            # All parameters have a non-zero gradient, so the contracted results already
+            # are the transposed Jacobian and do not need to be unstacked and restacked.
+            return qml.math.T(nonzero_grads)
+
+        grads = []
+        idx = 0
+        zero_rep = None
+
+        for s in shapes:
+
+            if s == 0:
+                # parameter has zero gradient; the zero-valued gradient is
+                # created once and shared between all such parameters
+                if zero_rep is None:
+                    zero_rep = qml.math.zeros_like(nonzero_grads[0])
+
+                grads.append(zero_rep)
+                continue
+
+            grads.append(nonzero_grads[idx])
+            idx += 1
+
+        if ragged:
+            for i, g in enumerate(grads):
                 if qml.math.ndim(g) > 0:
                     grads[i] = qml.math.hstack(g)
 
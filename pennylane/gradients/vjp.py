@@ -44,22 +44,23 @@ def compute_vjp(dy, jac, num=None):
     if num is None:
         num = math.shape(dy_row)[0]
 
-    if not isinstance(dy_row, np.ndarray):
-        jac = math.convert_like(jac, dy_row)
-        jac = math.cast(jac, dy_row.dtype)
-
-    jac = math.reshape(jac, [num, -1])
-
     try:
         if math.allclose(dy, 0):
             # If the dy vector is zero, then the
-            # corresponding element of the VJP will be zero.
-            num_params = jac.shape[1]
+            # corresponding element of the VJP will be zero,
+            # and the Jacobian does not need to be converted.
+            num_params = math.shape(math.reshape(jac, [num, -1]))[1]
             res = math.convert_like(np.zeros([num_params]), dy)
             return math.cast(res, dy.dtype)
     except (AttributeError, TypeError):
         pass
 
+    if not isinstance(dy_row, np.ndarray):
+        jac = math.convert_like(jac, dy_row)
+        jac = math.cast(jac, dy_row.dtype)
+
+    jac = math.reshape(jac, [num, -1])
+
     return math.tensordot(jac, dy_row, [[0], [0]])
 
 
@@ -87,6 +87,15 @@ class TestCoeffs:
         assert np.allclose(coeffs, [-2.5, 4 / 3, 4 / 3, -1 / 12, -1 / 12])
         assert np.allclose(shifts, [0, -1, 1, -2, 2])
 
+    def test_output_is_cached_and_read_only(self):
+        """Test that repeated calls return the same cached array, and that
+        this array cannot be modified in-place"""
+        res = finite_diff_coeffs(1, 2, "forward")
+        assert finite_diff_coeffs(1, 2, "forward") is res
+
+        with pytest.raises(ValueError, match="read-only"):
+            res[0, 0] = 1.0
+
 
 class TestFiniteDiff:
     """Tests for the finite difference gradient transform"""
@@ -314,6 +323,25 @@ class TestFiniteDiff:
         assert np.allclose(j1, [exp, 0])
         assert np.allclose(j2, [0, exp])
 
+    def test_all_selected_parameters_independent(self):
+        """Test that the gradient is zero, with the shape of the tape output, if all parameters
+        selected via ``argnum`` are independent of the output."""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.5, wires=[0])
+            qml.RY(0.3, wires=[1])
+            qml.expval(qml.PauliZ(0))
+
+        tapes, fn = finite_diff(tape, argnum=1)
+
+        # only the unshifted tape is executed
+        assert len(tapes) == 1
+
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (1, 2)
+        assert np.allclose(res, 0)
+
     def test_output_shape_matches_qnode(self):
         """Test that the transform output shape matches that of the QNode."""
         dev = qml.device("default.qubit", wires=4)
@@ -605,6 +633,182 @@ class TestFiniteDiffIntegration:
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
 
+@pytest.mark.parametrize("approx_order", [2, 4])
+@pytest.mark.parametrize("strategy", ["forward", "backward", "center"])
+class TestFiniteDiffBroadcast:
+    """Tests for the finite difference gradient transform using broadcasting"""
+
+    def test_broadcasted_tapes(self, approx_order, strategy):
+        """Test that a single broadcasted tape is created per trainable parameter"""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        tapes, _ = finite_diff(tape, approx_order=approx_order, strategy=strategy)
+        b_tapes, _ = finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+
+        unshifted = [t for t in b_tapes if t.batch_size is None]
+        assert len(unshifted) == (0 if strategy == "center" else 1)
+
+        shifted = [t for t in b_tapes if t.batch_size is not None]
+        assert len(shifted) == 2
+        assert sum(t.batch_size for t in shifted) == len(tapes) - len(unshifted)
+
+    def test_fallback_for_unsupported_operation(self, approx_order, strategy, tol):
+        """Test that one tape per shift is created if an operation with a
+        trainable parameter does not support broadcasting"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.Hadamard(wires=[0])
+            qml.RX(0.543, wires=[0])
+            qml.PSWAP(-0.654, wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        assert qml.PSWAP not in qml.ops.qubit.attributes.supports_broadcasting
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy)
+        b_tapes, b_fn = finite_diff(
+            tape, approx_order=approx_order, strategy=strategy, broadcast=True
+        )
+
+        assert len(b_tapes) == len(tapes)
+        assert all(t.batch_size is None for t in b_tapes)
+        assert np.allclose(
+            b_fn(dev.batch_execute(b_tapes)), fn(dev.batch_execute(tapes)), atol=tol, rtol=0
+        )
+
+    def test_single_expectation_value(self, approx_order, strategy, tol):
+        """Tests correct output shape and evaluation for a tape
+        with a single expval output"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (1, 2)
+
+        expected = np.array([[-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)]])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_probs_with_independent_parameter(self, approx_order, strategy, tol):
+        """Tests correct output shape and evaluation for a tape with a
+        probability output and a parameter with zero gradient"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.probs(wires=[0])
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (2, 1, 2)
+
+        expected = np.array([[[-np.sin(x) / 2, 0]], [[np.sin(x) / 2, 0]]])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_multiple_measurements_error(self, approx_order, strategy):
+        """Test that an error is raised if broadcasting is used
+        with multiple measurements"""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.expval(qml.PauliZ(0))
+            qml.probs(wires=[0])
+
+        with pytest.raises(NotImplementedError, match="Broadcasting with multiple measurements"):
+            finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+
+    def test_trainable_parameters(self, approx_order, strategy, tol):
+        """Test that broadcasted tapes are created for a tape with trainable
+        parameters that are not being differentiated"""
+        dev = qml.device("default.qubit", wires=2)
+        x = np.array(0.543, requires_grad=True)
+        y = np.array(-0.654, requires_grad=True)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+        assert len([t for t in tapes if t.batch_size is not None]) == 2
+
+        res = fn(dev.batch_execute(tapes))
+        expected = np.array([[-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)]])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_qnode_transform(self, approx_order, strategy, mocker, tol):
+        """Test that broadcasted tapes are created when applying the
+        transform to a QNode with trainable parameters"""
+        dev = qml.device("default.qubit", wires=2)
+        params = np.array([0.543, -0.654], requires_grad=True)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x[0], wires=[0])
+            qml.RY(x[1], wires=[1])
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        spy = mocker.spy(qml.gradients.finite_difference, "generate_shifted_tapes")
+        res = finite_diff(circuit, approx_order=approx_order, strategy=strategy, broadcast=True)(
+            params
+        )
+
+        assert spy.call_count == 2
+        assert all(call.kwargs["broadcast"] for call in spy.call_args_list)
+
+        x, y = params
+        expected = np.array([-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.autograd
+    def test_autograd_hessian(self, approx_order, strategy, tol):
+        """Test that second derivatives of a QNode using broadcasting are correct. The
+        trainable parameters are being differentiated by Autograd when computing the
+        inner derivative, so that one tape per shift has to be used instead."""
+        dev = qml.device("default.qubit", wires=2)
+        params = np.array([0.543, -0.654], requires_grad=True)
+
+        @qml.qnode(
+            dev,
+            diff_method="finite-diff",
+            approx_order=approx_order,
+            strategy=strategy,
+            h=1e-3,
+            max_diff=2,
+            broadcast=True,
+        )
+        def circuit(x):
+            qml.RX(x[0], wires=[0])
+            qml.RY(x[1], wires=[1])
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        res = qml.jacobian(qml.grad(circuit))(params)
+
+        x, y = params
+        expected = np.array(
+            [
+                [-np.cos(x) * np.cos(y), np.sin(x) * np.sin(y)],
+                [np.sin(x) * np.sin(y), -np.cos(x) * np.cos(y)],
+            ]
+        )
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
 @pytest.mark.parametrize("approx_order", [2])
 @pytest.mark.parametrize("strategy", ["center"])
 class TestFiniteDiffGradients:
@@ -410,6 +410,30 @@ class TestFiniteDiff:
         assert np.allclose(j1, [exp, 0])
         assert np.allclose(j2, [0, exp])
 
+    def test_all_selected_parameters_independent(self):
+        """Test that the gradients are zero, with the shape of the tape output, if all parameters
+        selected via ``argnum`` are independent of the output."""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.5, wires=[0])
+            qml.RY(0.3, wires=[1])
+            qml.expval(qml.PauliZ(0))
+
+        tapes, fn = finite_diff(tape, argnum=1)
+
+        # only the unshifted tape is executed
+        assert len(tapes) == 1
+
+        res = fn(dev.batch_execute(tapes))
+        assert isinstance(res, tuple)
+        assert len(res) == 2
+
+        for r in res:
+            assert isinstance(r, np.ndarray)
+            assert r.shape == ()
+            assert np.allclose(r, 0)
+
     def test_output_shape_matches_qnode(self):
         """Test that the transform output shape matches that of the QNode."""
         dev = qml.device("default.qubit", wires=4)
@@ -816,6 +840,74 @@ class TestFiniteDiffIntegration:
         assert isinstance(res[1][1], numpy.ndarray)
 
 
+@pytest.mark.parametrize("approx_order", [2, 4])
+@pytest.mark.parametrize("strategy", ["forward", "backward", "center"])
+class TestFiniteDiffBroadcast:
+    """Tests for the finite difference gradient transform using broadcasting"""
+
+    def test_single_expectation_value(self, approx_order, strategy, tol):
+        """Tests correct output shape and evaluation for a tape
+        with a single expval output"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+        assert len(tapes) == (2 if strategy == "center" else 3)
+        res = fn(dev.batch_execute(tapes))
+
+        assert isinstance(res, tuple)
+        assert len(res) == 2
+
+        assert isinstance(res[0], numpy.ndarray)
+        assert res[0].shape == ()
+
+        assert isinstance(res[1], numpy.ndarray)
+        assert res[1].shape == ()
+
+        expected = np.array([[-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)]])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_probs_with_independent_parameter(self, approx_order, strategy, tol):
+        """Tests correct output shape and evaluation for a tape with a
+        probability output and a parameter with zero gradient"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.probs(wires=[0])
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+        res = fn(dev.batch_execute(tapes))
+
+        assert isinstance(res, tuple)
+        assert len(res) == 2
+        assert res[0].shape == res[1].shape == (2,)
+
+        assert np.allclose(res[0], [-np.sin(x) / 2, np.sin(x) / 2], atol=tol, rtol=0)
+        assert np.allclose(res[1], [0, 0], atol=tol, rtol=0)
+
+    def test_multiple_measurements_error(self, approx_order, strategy):
+        """Test that an error is raised if broadcasting is used
+        with multiple measurements"""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.expval(qml.PauliZ(0))
+            qml.probs(wires=[0])
+
+        with pytest.raises(NotImplementedError, match="Broadcasting with multiple measurements"):
+            finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+
+
 @pytest.mark.parametrize("approx_order", [2])
 @pytest.mark.parametrize("strategy", ["center"])
 class TestFiniteDiffGradients: